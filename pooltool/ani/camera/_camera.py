@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import math
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Union
 
@@ -17,6 +18,9 @@ from pooltool.math import wiggle
 from pooltool.objects.table.datatypes import Table
 from pooltool.serialize import conversion
 
+_DEG2RAD = math.pi / 180
+_HALF_PI = math.pi / 2
+
 
 class Camera:
     @require_showbase
@@ -108,12 +112,19 @@ class Camera:
         with mouse:
             dxp, dyp = mouse.get_dx(), mouse.get_dy()
 
-        h = self.fixation.getH() * np.pi / 180 + np.pi / 2
-        dx = dxp * np.cos(h) - dyp * np.sin(h)
-        dy = dxp * np.sin(h) + dyp * np.cos(h)
-
-        self.fixation.setX(self.fixation.getX() + dx * ani.move_sensitivity)
-        self.fixation.setY(self.fixation.getY() + dy * ani.move_sensitivity)
+        # Scalar math.cos/math.sin avoid numpy's ufunc dispatch, which dominates for
+        # a single float
+        h = self.fixation.getH() * _DEG2RAD + _HALF_PI
+        cos_h, sin_h = math.cos(h), math.sin(h)
+        dx = dxp * cos_h - dyp * sin_h
+        dy = dxp * sin_h + dyp * cos_h
+
+        # One read and one write of the position, rather than a getter and setter call
+        # per axis
+        x, y, z = self.fixation.getPos()
+        self.fixation.setPos(
+            x + dx * ani.move_sensitivity, y + dy * ani.move_sensitivity, z
+        )
 
     def fixate(self, pos, node):
         """Fixate on a position
@@ -33,6 +33,22 @@ def require_showbase(func):
     return wrapper
 
 
+def _get_showbase(name: str):
+    """Return the ShowBase instance, or raise if none exists
+
+    This is the lookup behind the `Global` properties, which are accessed every frame.
+    Rather than checking with `is_showbase_initialized` first, the attribute access is
+    simply attempted, which costs nothing extra when ShowBase exists.
+    """
+    try:
+        return ShowBaseGlobal.base
+    except AttributeError:
+        raise ConfigError(
+            f"ShowBase instance has not been initialized, but a function has been "
+            f"called that requires it: '{name}'."
+        ) from None
+
+
 class Global:
     """A namespace for shared variables
 
@@ -59,24 +75,20 @@ class Global:
     mode_mgr = None
 
     @classproperty
-    @require_showbase
     def base(self):
-        return ShowBaseGlobal.base
+        return _get_showbase("base")
 
     @classproperty
-    @require_showbase
     def render(self):
-        return ShowBaseGlobal.base.render
+        return _get_showbase("render").render
 
     @classproperty
-    @require_showbase
     def task_mgr(self):
-        return ShowBaseGlobal.base.taskMgr
+        return _get_showbase("task_mgr").taskMgr
 
     @classproperty
-    @require_showbase
     def loader(self):
-        return ShowBaseGlobal.base.loader
+        return _get_showbase("loader").loader
 
     @classmethod
     def register_game(cls, game):
@@ -1,4 +1,4 @@
-from typing import Any, List, Protocol, Tuple
+from typing import Any, Optional, Protocol, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
@@ -20,7 +20,13 @@ class Exporter(Protocol):
 
 
 def get_graphics_texture() -> Texture:
-    """Clear all existing image textures, then return a new one"""
+    """Clear all existing image textures, then return a new one
+
+    The texture is bound with RTMCopyRam, so the framebuffer is copied to system RAM
+    at the end of each rendered frame. Panda3D 1.10 offers no asynchronous (PBO-style)
+    readback, so double-buffering two textures would not overlap rendering with the
+    copy--the readback simply happens as part of each `task_mgr.step()`.
+    """
     tex = Texture()
     Global.base.win.clearRenderTextures()
     Global.base.win.addRenderTexture(
@@ -57,22 +63,47 @@ def image_stack(
     tex = get_graphics_texture()
 
     if show_hud:
-        hud.init()
+        # The HUD is likely still up from a previous call. Initializing it again would
+        # rebuild every element (without destroying the existing ones)
+        if not hud.initialized:
+            hud.init()
         hud.elements[HUDElement.help_text].help_hint.hide()
         hud.update_cue(system.cue)
     else:
+        # Returns immediately if the HUD is already destroyed
         hud.destroy()
 
     cam.load_state(camera_state)
 
-    # Initialize a numpy array image stack
-    imgs: List[NDArray[np.uint8]] = []
+    # The image stack is allocated once the first frame reveals the texture dimensions.
+    # Each frame is then written directly into its slice of the stack. The dimensions
+    # are fixed, so they are only queried from the texture once. Grayscale frames are
+    # converted one at a time, via a single RGB frame buffer, so that the RGB stack is
+    # never held in memory.
+    shape: Optional[Tuple[int, int, int]] = None
+    stack: Optional[NDArray[np.uint8]] = None
+    rgb: Optional[NDArray[np.uint8]] = None
 
     for frame in range(frames):
         next(iterator)
-        imgs.append(image_array_from_texture(tex, gray=gray))
 
-    return np.array(imgs, dtype=np.uint8)
+        if stack is None:
+            shape = _ram_image_shape(tex)
+            if gray:
+                stack = np.empty((frames, *shape[:2]), dtype=np.uint8)
+                rgb = np.empty(shape, dtype=np.uint8)
+            else:
+                stack = np.empty((frames, *shape), dtype=np.uint8)
+
+        if rgb is not None:
+            _copy_rgb(tex, out=rgb, shape=shape)
+            stack[frame] = rgb2gray(rgb)
+        else:
+            _copy_rgb(tex, out=stack[frame], shape=shape)
+
+    assert stack is not None
+
+    return stack
 
 
 def save_images(
@@ -99,16 +130,52 @@ def save_images(
 
 
 def image_array_from_texture(tex: Texture, gray: bool = False) -> NDArray[np.uint8]:
-    assert tex.hasRamImage()
+    array = np.empty(_ram_image_shape(tex), dtype=np.uint8)
+    _copy_rgb(tex, out=array)
+    return rgb2gray(array) if gray else array
 
-    array = np.copy(np.frombuffer(tex.getRamImage(), dtype=np.uint8))
-    array.shape = (
-        tex.getYSize(),
-        tex.getXSize(),
-        tex.getNumComponents(),
-    )
 
-    # This flips things rightside up and orders RGB correctly
-    array = array[::-1, :, ::-1]
+def _copy_rgb(
+    tex: Texture,
+    out: NDArray[np.uint8],
+    shape: Optional[Tuple[int, int, int]] = None,
+) -> None:
+    """Copy the texture's RAM image into `out`, rightside up and in RGB
 
-    return rgb2gray(array) if gray else array
+    This is equivalent to `out[...] = _ram_image(tex)[::-1, :, ::-1]`, which numpy
+    copies one element at a time because the innermost axis is reversed.
+
+    Args:
+        shape:
+            The shape of the RAM image (see `_ram_image_shape`). If None, it is queried
+            from the texture.
+    """
+    if shape is None:
+        shape = _ram_image_shape(tex)
+
+    if shape[-1] == 3:
+        # The common case, since the window has no alpha channel. Panda3D reorders BGR
+        # to RGB faster than numpy can, leaving only the row flip to numpy
+        rgb = np.frombuffer(tex.getRamImageAs("RGB"), dtype=np.uint8)
+        out[...] = rgb.reshape(shape)[::-1]
+        return
+
+    # Otherwise, copy one channel at a time
+    flipped = _ram_image(tex, shape)[::-1]
+    num_components = shape[-1]
+    for channel in range(num_components):
+        out[..., channel] = flipped[..., num_components - 1 - channel]
+
+
+def _ram_image(
+    tex: Texture, shape: Optional[Tuple[int, int, int]] = None
+) -> NDArray[np.uint8]:
+    if shape is None:
+        assert tex.hasRamImage()
+        shape = _ram_image_shape(tex)
+
+    return np.frombuffer(tex.getRamImage(), dtype=np.uint8).reshape(shape)
+
+
+def _ram_image_shape(tex: Texture) -> Tuple[int, int, int]:
+    return tex.getYSize(), tex.getXSize(), tex.getNumComponents()
@@ -32,6 +32,18 @@ def _img_regex_pattern():
     return re.compile(r".*_[0-9]{6,6}\." + ImageExt.regex())
 
 
+def _stack(img_arrays: List[NDArray]) -> NDArray[np.uint8]:
+    """Stack equally sized images into a single (N, ...) array
+
+    np.stack copies each image into the output with a single memcpy, rather than
+    coercing the list element-by-element like np.array does.
+    """
+    if not len(img_arrays):
+        return np.empty(0, dtype=np.uint8)
+
+    return np.stack(img_arrays, axis=0).astype(np.uint8, copy=False)
+
+
 @attrs.define
 class ImageZip(ImageStorageMethod):
     """Exporter for creating a zipfile of images"""
@@ -107,7 +119,7 @@ class ImageZip(ImageStorageMethod):
                 continue
             img_arrays.append(path2imgarray(img_path))
 
-        return np.array(img_arrays, dtype=np.uint8)
+        return _stack(img_arrays)
 
     @staticmethod
     def _read_zip(path: Path) -> NDArray[np.uint8]:
@@ -123,7 +135,7 @@ class ImageZip(ImageStorageMethod):
 
                 img_arrays.append(img2array(Image.open(archive.open(filename))))
 
-        return np.array(img_arrays, dtype=np.uint8)
+        return _stack(img_arrays)
 
 
 @attrs.define
@@ -137,7 +149,8 @@ class HDF5Images(ImageStorageMethod):
     @staticmethod
     def read(path: Union[str, Path]) -> NDArray[np.uint8]:
         with h5py.File(path, "r+") as fp:
-            return np.array(fp["/images"]).astype("uint8")
+            # Read the dataset straight into an array. The cast is a no-op for uint8 data
+            return fp["/images"][()].astype(np.uint8, copy=False)
 
 
 @attrs.define
@@ -39,8 +39,15 @@ def gif(
 
 
 def rgb2gray(rgb: NDArray[np.uint8]) -> NDArray[np.uint8]:
-    """Convert an image (or image stack) to grayscale"""
-    return np.array(Image.fromarray(rgb).convert(mode="L"))
+    """Convert an RGB(A) image (or image stack) to grayscale
+
+    This is PIL's mode "L" conversion. A (N, y, x, 3) stack is converted in one call by
+    stacking its frames into a single (N * y, x, 3) image, which is faster than
+    converting frame by frame (or than a numpy dot product with the luma weights).
+    """
+    *shape, x, channels = rgb.shape
+    frames = Image.fromarray(rgb.reshape(-1, x, channels))
+    return np.asarray(frames.convert(mode="L")).reshape(*shape, x)
 
 
 def path2imgarray(img_path: Path):
@@ -99,6 +99,16 @@ class ShotMode(BaseMode):
         self.register_keymap_event("p-up", Action.prev_shot, True)
         self.register_keymap_event("enter-up", Action.parallel, True)
 
+        # Handlers of shot_view_task, in order of precedence. Building this once avoids
+        # resolving each Action member (a surprisingly slow Enum class attribute lookup)
+        # every frame
+        self.view_dispatch = (
+            (Action.close_scene, self.close_scene),
+            (Action.aim, self.advance_shot),
+            (Action.zoom, cam.zoom_via_mouse),
+            (Action.move, cam.move_fixation_via_mouse),
+        )
+
         tasks.add(self.shot_view_task, "shot_view_task")
         tasks.add(self.shot_animation_task, "shot_animation_task")
         tasks.add(self.shared_task, "shared_task")
@@ -185,40 +195,47 @@ class ShotMode(BaseMode):
         tasks.remove("shared_task")
 
     def shot_view_task(self, task):
-        if self.keymap[Action.close_scene]:
-            cam.store_state("last_scene", overwrite=True)
-            Global.base.messenger.send("close-scene")
-            Global.mode_mgr.end_mode()
-            Global.base.messenger.send("stop")
-
-        elif self.keymap[Action.aim] or visual.animation_finished:
-            # Either the user has requested to start the next shot, or the animation has
-            # finished
-            Global.game.advance(multisystem[-1])
-            if Global.game.game_over:
-                Global.mode_mgr.change_mode(Mode.game_over)
+        keymap = self.keymap
+        finished = visual.animation_finished
+        for action, handler in self.view_dispatch:
+            # A finished animation advances to the next shot, just as though the user
+            # requested it
+            if keymap[action] or (finished and action is Action.aim):
+                handler()
+                break
+        else:
+            if task.time > ani.rotate_downtime:
+                # Only rotate the camera if some time has passed since the mode was
+                # entered, otherwise the shot followthrough jarringly rotates the camera
+                cam.rotate_via_mouse()
             else:
-                Global.mode_mgr.change_mode(Mode.aim, exit_kwargs=dict(key="advance"))
-
-        elif self.keymap[Action.zoom]:
-            cam.zoom_via_mouse()
+                # We didn't do anything this frame, but touch the mouse so any future
+                # mouse movements don't experience a big jump
+                mouse.touch()
 
-        elif self.keymap[Action.move]:
-            cam.move_fixation_via_mouse()
+        return task.cont
 
-        elif task.time > ani.rotate_downtime:
-            # Only rotate the camera if some time has passed since the mode was entered,
-            # otherwise the shot followthrough jarringly rotates the camera
-            cam.rotate_via_mouse()
+    @staticmethod
+    def close_scene():
+        cam.store_state("last_scene", overwrite=True)
+        Global.base.messenger.send("close-scene")
+        Global.mode_mgr.end_mode()
+        Global.base.messenger.send("stop")
 
+    @staticmethod
+    def advance_shot():
+        Global.game.advance(multisystem[-1])
+        if Global.game.game_over:
+            Global.mode_mgr.change_mode(Mode.game_over)
         else:
-            # We didn't do anything this frame, but touch the mouse so any future mouse
-            # movements don't experience a big jump
-            mouse.touch()
-
-        return task.cont
+            Global.mode_mgr.change_mode(Mode.aim, exit_kwargs=dict(key="advance"))
 
     def shot_animation_task(self, task):
+        if not any(self.keymap.values()):
+            # Nothing is pressed, which is true for most frames. One pass over the
+            # keymap's values is cheaper than resolving each Action member below
+            return task.cont
+
         if self.keymap[Action.restart_ani]:
             visual.playback(PlaybackMode.LOOP)
             visual.restart_animation()
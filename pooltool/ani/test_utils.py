@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from panda3d.core import Quat
+
+from pooltool.ani.utils import as_quaternion
+from pooltool.math import unit_vector_slow
+
+
+def _composed_quats(w, t, dQ_0=None):
+    """Compose the infinitesimal quaternions with Panda3D's (single precision) Quats"""
+    w_norm = np.linalg.norm(w, axis=1)
+    w_unit = unit_vector_slow(w, handle_zero=True)
+    half_theta = w_norm[1:] * np.diff(t) / 2
+
+    # Quaternion looks like m + xi + yj + zk, with dQ_0 as the first point
+    dQ = np.empty((len(t), 4), dtype=np.float64)
+    dQ[0] = (1, 0, 0, 0) if dQ_0 is None else dQ_0
+    dQ[1:, 0] = np.cos(half_theta)
+    dQ[1:, 1:] = w_unit[1:] * np.sin(half_theta)[:, None]
+    dQ /= np.linalg.norm(dQ, axis=1, keepdims=True)
+
+    quats = [Quat(*dQ[0])]
+    for row in dQ[1:].tolist():
+        quats.append(quats[-1] * Quat(*row))
+
+    return quats
+
+
+@pytest.mark.parametrize("dQ_0", [None, (0.5, 0.5, 0.5, 0.5)])
+def test_as_quaternion(dQ_0):
+    rng = np.random.default_rng(42)
+    w = rng.normal(scale=20, size=(500, 3))
+    w[100:200] = 0
+    t = np.arange(500) * 0.01
+
+    expected = _composed_quats(w, t, dQ_0)
+    quats = as_quaternion(w, t, dQ_0)
+
+    assert len(quats) == len(expected)
+    assert np.allclose(
+        [list(quat) for quat in quats], [list(quat) for quat in expected], atol=1e-5
+    )
@@ -1,13 +1,15 @@
 #! /usr/bin/env python
 
+from math import cos, sin, sqrt
 from typing import List
 
 import numpy as np
 from direct.gui.DirectGui import DGG
 from direct.gui.DirectGuiBase import DirectGuiWidget
+from numba import jit
 from panda3d.core import LVector3, NodePath, PGItem, Quat, Vec3, Vec4
 
-import pooltool.math as math
+import pooltool.constants as const
 
 
 def get_list_of_Vec3s_from_array(array):
@@ -28,48 +30,56 @@ def as_quaternion(w, t, dQ_0=None) -> List:
       https://stackoverflow.com/questions/23503151/how-to-update-quaternion-based-on-3d-gyro-data/41226401
       Though as pointed out by jrichner, the correct quaternions are produced
       only after reversing the order of multiplication.
+    - Each infinitesimal rotation is composed with the previous quaternion in double
+      precision (see `_compose_quaternions`).
     """
-    dquats = get_infinitesimal_quaternions(w, t, dQ_0)
-    dquats = get_quaternion_list_from_array(dquats)
-
-    quats = [dquats[0]]
-    for i in range(1, len(dquats)):
-        quats.append(quats[i - 1] * dquats[i])
-
-    return quats
-
-
-def get_infinitesimal_quaternions(w, t, dQ_0=None):
-    w_norm = np.linalg.norm(w, axis=1)
-    w_unit = math.unit_vector_slow(w, handle_zero=True)
-
-    dt = np.diff(t)
-    theta = w_norm[1:] * dt
-
-    # Quaternion looks like m + xi + yj + zk
-    dQ_m = np.cos(theta / 2)[:, None]
-    dQ_xyz = w_unit[1:] * np.sin(theta / 2)[:, None]
-    dQ = np.hstack([dQ_m, dQ_xyz])
+    dQ_0 = np.array((1, 0, 0, 0) if dQ_0 is None else dQ_0, dtype=np.float64)
+    quats = _compose_quaternions(
+        np.asarray(w, dtype=np.float64), np.asarray(t, dtype=np.float64), dQ_0
+    )
 
-    # Since the time elapsed is calculated from a difference of timestamps
-    # there is one less datapoint than needed. I remedy this by adding the
-    # identity quaternion as the first point
-    if dQ_0 is None:
-        dQ_0 = np.array([1, 0, 0, 0])
-    else:
-        dQ_0 = np.array(dQ_0)
-    dQ_0 = get_quat_from_vector(dQ_0)
+    return [Quat(*row) for row in quats.tolist()]
 
-    dQ = np.vstack([dQ_0, dQ])
 
-    return dQ
+@jit(nopython=True, cache=const.numba_cache)
+def _compose_quaternions(w, t, dQ_0):
+    """Integrate angular velocities into quaternions (just-in-time compiled)
 
+    Each infinitesimal rotation is calculated and composed with the previous
+    quaternion in a single pass, with no intermediate arrays.
 
-def get_quaternion_list_from_array(array):
-    """array is shape (N, 4)"""
-    quats = []
-    for i in range(array.shape[0]):
-        quats.append(get_quat_from_vector(array[i, :]))
+    Returns:
+        An (N, 4) array of quaternions, each looking like m + xi + yj + zk.
+    """
+    quats = np.empty((len(t), 4), dtype=np.float64)
+
+    norm = sqrt(dQ_0[0] ** 2 + dQ_0[1] ** 2 + dQ_0[2] ** 2 + dQ_0[3] ** 2)
+    m, x, y, z = dQ_0[0] / norm, dQ_0[1] / norm, dQ_0[2] / norm, dQ_0[3] / norm
+    quats[0] = m, x, y, z
+
+    for i in range(1, len(t)):
+        wx, wy, wz = w[i, 0], w[i, 1], w[i, 2]
+        w_norm = sqrt(wx * wx + wy * wy + wz * wz)
+
+        if w_norm == 0:
+            # No rotation, so the quaternion is unchanged
+            quats[i] = m, x, y, z
+            continue
+
+        half_theta = w_norm * (t[i] - t[i - 1]) / 2
+        dm = cos(half_theta)
+        scale = sin(half_theta) / w_norm
+        dx, dy, dz = wx * scale, wy * scale, wz * scale
+
+        # The infinitesimal rotation is applied after the current rotation, i.e. the
+        # product dQ * Q
+        m, x, y, z = (
+            dm * m - dx * x - dy * y - dz * z,
+            dm * x + dx * m + dy * z - dz * y,
+            dm * y - dx * z + dy * m + dz * x,
+            dm * z + dx * y - dy * x + dz * m,
+        )
+        quats[i] = m, x, y, z
 
     return quats
 
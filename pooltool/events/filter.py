@@ -47,13 +47,17 @@ def filter_ball(
     if isinstance(balls, str):
         balls = [balls]
 
+    # An agent's ID is its object's ID, so checking it first skips the isinstance check
+    # for agents that aren't of interest
+    ball_ids = set(balls)
+
     new: List[Event] = []
     for event in events:
         if keep_nonevent and event.event_type == EventType.NONE:
             new.append(event)
         else:
             for agent in event.agents:
-                if isinstance(agent.initial, Ball) and agent.initial.id in balls:
+                if agent.id in ball_ids and isinstance(agent.initial, Ball):
                     new.append(event)
                     break
 
@@ -1,3 +1,7 @@
+import numpy as np
+from numba import jit
+
+import pooltool.constants as const
 import pooltool.physics.evolve as evolve
 from pooltool.events import filter_ball
 from pooltool.objects.ball.datatypes import BallHistory, BallState
@@ -69,88 +73,148 @@ def continuize(system: System, dt: float = 0.01, inplace: bool = False) -> Syste
     num_timestamps = int(system.events[-1].time // dt) + 1
 
     for ball in system.balls.values():
-        # Create a new history and add the zeroth event
-        history = BallHistory()
-        history.add(ball.history[0])
-
-        rvw, s = ball.history[0].rvw, ball.history[0].s
-
         # Get all events that the ball is involved in, even the null_event events
         # that mark the start and end times
         events = filter_ball(system.events, ball.id, keep_nonevent=True)
 
-        # Tracks which event is currently being handled
-        count = 0
-
-        # The elapsed simulation time (as of the last timepoint)
-        elapsed = 0.0
-
-        for n in range(num_timestamps):
-            if n == (num_timestamps - 1):
-                # We made it to the end. the difference between the final time and
-                # the elapsed time should be < dt
-                assert events[-1].time - elapsed < dt
-                break
-
-            if events[count + 1].time - elapsed > dt:
-                # This is the easy case. There is no upcoming event so we simply
-                # evolve the state an amount dt
-                evolve_time = dt
-
-            else:
-                # The next event (and perhaps an arbitrary number of subsequent
-                # events) occurs before the next timestamp. Find the last event
-                # between the current timestamp and the next timestamp. This will be
-                # used as a launching point to simulate the ball state to the next
-                # timestamp
-
-                while True:
-                    count += 1
-
-                    if events[count + 1].time - elapsed > dt:
-                        # OK, we found the last event between the current timestamp
-                        # and the next timestamp. It is events[count].
-                        break
-
-                # We need to get the ball's outgoing state from the event. We'll
-                # evolve the system from this state.
-                for agent in events[count].agents:
-                    if agent.matches(ball):
-                        state = agent.final.state.copy()  # type: ignore
-                        break
-                else:
-                    raise ValueError("No agents in event match ball")
-
-                rvw, s = state.rvw, state.s
-
-                # Since this event occurs between two timestamps, we won't be
-                # evolving a full dt. Instead, we evolve this much:
-                evolve_time = elapsed + dt - events[count].time
-
-            # Whether it was the hard path or the easy path, the ball state is
-            # properly defined and we know how much we need to simulate.
-            rvw, s = evolve.evolve_ball_motion(
-                state=s,
-                rvw=rvw,
-                R=ball.params.R,
-                m=ball.params.m,
-                u_s=ball.params.u_s,
-                u_sp=ball.params.u_sp,
-                u_r=ball.params.u_r,
-                g=ball.params.g,
-                t=evolve_time,
-            )
-
-            history.add(BallState(rvw, s, elapsed + dt))
-            elapsed += dt
-
-        # There is a finale. The final state is missing from the continuous history,
-        # whose final state is within dt of the true final state. We add the final
-        # state to the continous history even though this breaks the promise of
-        # uniformly spaced timestamps
-        history.add(ball.history[-1])
-
-        # Attach the newly created history to the ball
-        ball.history_cts = history
+        # The ball's outgoing state from each event, which serves as a launching point
+        # whenever the event falls between two timestamps. Null events have no agents,
+        # which is flagged with a state of -1
+        event_times = np.empty(len(events), dtype=np.float64)
+        event_rvws = np.full((len(events), 3, 3), np.nan, dtype=np.float64)
+        event_states = np.full(len(events), -1, dtype=np.int64)
+
+        for i, event in enumerate(events):
+            event_times[i] = event.time
+            for agent in event.agents:
+                if agent.matches(ball):
+                    event_rvws[i] = agent.final.state.rvw  # type: ignore
+                    event_states[i] = agent.final.state.s  # type: ignore
+                    break
+
+        rvws, states, times = _continuize_ball(
+            ball.history[0].rvw,
+            ball.history[0].s,
+            event_times,
+            event_rvws,
+            event_states,
+            num_timestamps,
+            dt,
+            ball.params.R,
+            ball.params.m,
+            ball.params.u_s,
+            ball.params.u_sp,
+            ball.params.u_r,
+            ball.params.g,
+        )
+
+        # The history starts with the zeroth event. There is also a finale: the final
+        # state is missing from the continuous history, whose final state is within dt
+        # of the true final state. We add the final state to the continous history even
+        # though this breaks the promise of uniformly spaced timestamps
+        #
+        # The timestamps are in time order, so the states are gathered directly rather
+        # than validated one by one with `BallHistory.add`
+        ball.history_cts = BallHistory(
+            states=[
+                ball.history[0],
+                *map(BallState, rvws, states.tolist(), times.tolist()),
+                ball.history[-1],
+            ]
+        )
 
     return system
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def _continuize_ball(
+    rvw,
+    s,
+    event_times,
+    event_rvws,
+    event_states,
+    num_timestamps,
+    dt,
+    R,
+    m,
+    u_s,
+    u_sp,
+    u_r,
+    g,
+):
+    """Evolve a ball through its events, sampling its state every dt
+
+    Args:
+        event_times:
+            The times of the events the ball is involved in, including the null events
+            that mark the start and end times.
+        event_rvws:
+            The ball's outgoing rvw from each event.
+        event_states:
+            The ball's outgoing motion state from each event, or -1 if the ball isn't an
+            agent of the event.
+
+    Returns:
+        The rvw, motion state, and time of each timestamp, excluding the first and last
+        timepoints of the continuous history, which are the first and last states of
+        the ball's event-based history.
+    """
+    rvws = np.empty((num_timestamps - 1, 3, 3), dtype=np.float64)
+    states = np.empty(num_timestamps - 1, dtype=np.int64)
+    times = np.empty(num_timestamps - 1, dtype=np.float64)
+
+    # Tracks which event is currently being handled
+    count = 0
+
+    # The elapsed simulation time (as of the last timepoint)
+    elapsed = 0.0
+
+    for n in range(num_timestamps):
+        if n == (num_timestamps - 1):
+            # We made it to the end. the difference between the final time and the
+            # elapsed time should be < dt
+            assert event_times[-1] - elapsed < dt
+            break
+
+        if event_times[count + 1] - elapsed > dt:
+            # This is the easy case. There is no upcoming event so we simply evolve the
+            # state an amount dt
+            evolve_time = dt
+
+        else:
+            # The next event (and perhaps an arbitrary number of subsequent events)
+            # occurs before the next timestamp. Find the last event between the current
+            # timestamp and the next timestamp. This will be used as a launching point
+            # to simulate the ball state to the next timestamp
+            while True:
+                count += 1
+
+                if event_times[count + 1] - elapsed > dt:
+                    # OK, we found the last event between the current timestamp and the
+                    # next timestamp. It is events[count].
+                    break
+
+            if event_states[count] < 0:
+                raise ValueError("No agents in event match ball")
+
+            # We evolve the system from the ball's outgoing state
+            rvw, s = event_rvws[count], event_states[count]
+
+            # Since this event occurs between two timestamps, we won't be evolving a
+            # full dt. Instead, we evolve this much:
+            evolve_time = elapsed + dt - event_times[count]
+
+        # Whether it was the hard path or the easy path, the ball state is properly
+        # defined and we know how much we need to simulate.
+        rvws[n], s = evolve.evolve_ball_motion(
+            s, rvw, R, m, u_s, u_sp, u_r, g, evolve_time
+        )
+
+        # Evolve from the recorded state, which (unlike the evolved state) is
+        # contiguous
+        rvw = rvws[n]
+        states[n] = s
+        times[n] = elapsed + dt
+        elapsed += dt
+
+    return rvws, states, times
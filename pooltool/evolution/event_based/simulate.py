@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from itertools import combinations
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import attrs
 import numpy as np
+from numpy.typing import NDArray
 
 import pooltool.constants as const
 import pooltool.math as math
@@ -31,15 +31,35 @@ from pooltool.evolution.continuize import continuize
 from pooltool.evolution.event_based import solve
 from pooltool.evolution.event_based.config import INCLUDED_EVENTS
 from pooltool.math.roots.quartic import QuarticSolver
-from pooltool.objects.ball.datatypes import Ball, BallState
+from pooltool.objects.ball.datatypes import (
+    Ball,
+    BallArrays,
+    BallOrientation,
+    BallState,
+)
 from pooltool.objects.table.components import (
     CircularCushionSegment,
     LinearCushionSegment,
     Pocket,
 )
+from pooltool.objects.table.datatypes import TableArrays
 from pooltool.physics.engine import PhysicsEngine
 from pooltool.system.datatypes import System
 
+# Stand-ins for the agents of events that never happen (they occur at time=inf). An
+# event's agents only record the ID and type of each object, so these are shared rather
+# than created for every call. The ball is given a fixed orientation because, unlike
+# `Ball.dummy()`, creating it then doesn't draw from numpy's global random state
+_DUMMY_BALL = Ball(
+    id="dummy",
+    initial_orientation=BallOrientation(
+        pos=(1.0, 1.0, 1.0, 1.0), sphere=(1.0, 0.0, 0.0, 0.0)
+    ),
+)
+_DUMMY_LINEAR_CUSHION = LinearCushionSegment.dummy()
+_DUMMY_CIRCULAR_CUSHION = CircularCushionSegment.dummy()
+_DUMMY_POCKET = Pocket.dummy()
+
 
 def simulate(
     shot: System,
@@ -144,10 +164,21 @@ def simulate(
         shot.update_history(event)
 
     transition_cache = TransitionCache.create(shot)
+    collision_cache = CollisionCache.create(shot)
+
+    # The balls, their parameters, and the table don't change during the simulation, so
+    # they are gathered once. Only the ball states are gathered for each event
+    ball_arrays = BallArrays.from_balls(tuple(shot.balls.values()))
+    table_arrays = TableArrays.from_table(shot.table)
 
     while True:
         event = get_next_event(
-            shot, transition_cache=transition_cache, quartic_solver=quartic_solver
+            shot,
+            transition_cache=transition_cache,
+            collision_cache=collision_cache,
+            ball_arrays=ball_arrays.with_current_states(),
+            table_arrays=table_arrays,
+            quartic_solver=quartic_solver,
         )
 
         if event.time == np.inf:
@@ -160,6 +191,10 @@ def simulate(
             engine.resolver.resolve(shot, event)
             transition_cache.update(event)
 
+        # The collisions of the event's balls are searched for again, even if the event
+        # isn't resolved
+        collision_cache.invalidate(event)
+
         shot.update_history(event)
 
         if t_final is not None and shot.t >= t_final:
@@ -180,52 +215,98 @@ def _evolve(shot: System, dt: float):
     partial function so parameters don't continuously need to be passed
     """
 
-    for ball_id, ball in shot.balls.items():
+    t = shot.t + dt
+
+    for ball in shot.balls.values():
+        state = ball.state
+
+        if state.s == const.stationary or state.s == const.pocketed:
+            # The ball doesn't move, so skip the call to evolve_state_motion
+            ball.state = BallState(state.rvw, state.s, t)
+            continue
+
+        params = ball.params
         rvw, s = evolve.evolve_state_motion(
-            state=ball.state.s,
-            rvw=ball.state.rvw,
-            R=ball.params.R,
-            m=ball.params.m,
-            u_s=ball.params.u_s,
-            u_sp=ball.params.u_sp,
-            u_r=ball.params.u_r,
-            g=ball.params.g,
-            t=dt,
+            state.s,
+            state.rvw,
+            params.R,
+            params.m,
+            params.u_s,
+            params.u_sp,
+            params.u_r,
+            params.g,
+            dt,
         )
-        ball.state = BallState(rvw, s, shot.t + dt)
+        ball.state = BallState(rvw, s, t)
 
 
 def get_next_event(
     shot: System,
     *,
     transition_cache: Optional[TransitionCache] = None,
+    collision_cache: Optional[CollisionCache] = None,
+    ball_arrays: Optional[BallArrays] = None,
+    table_arrays: Optional[TableArrays] = None,
     quartic_solver: QuarticSolver = QuarticSolver.HYBRID,
 ) -> Event:
+    """Returns the next event
+
+    Args:
+        ball_arrays:
+            The shot's balls with their current states (see `BallArrays`), if available.
+        table_arrays:
+            The shot's table, stacked into arrays (see `TableArrays`), if available.
+    """
     # Start by assuming next event doesn't happen
     event = null_event(time=np.inf)
 
     if transition_cache is None:
         transition_cache = TransitionCache.create(shot)
 
+    # The balls and table are gathered once and shared by each search
+    ball_arrays, table_arrays, collision_cache = _search_inputs(
+        shot, ball_arrays, table_arrays, collision_cache
+    )
+
     transition_event = transition_cache.get_next()
     if transition_event.time < event.time:
         event = transition_event
 
-    ball_ball_event = get_next_ball_ball_collision(shot, solver=quartic_solver)
+    ball_ball_event = get_next_ball_ball_collision(
+        shot,
+        solver=quartic_solver,
+        ball_arrays=ball_arrays,
+        collision_cache=collision_cache,
+    )
     if ball_ball_event.time < event.time:
         event = ball_ball_event
 
-    ball_linear_cushion_event = get_next_ball_linear_cushion_collision(shot)
+    ball_linear_cushion_event = get_next_ball_linear_cushion_collision(
+        shot,
+        ball_arrays=ball_arrays,
+        table_arrays=table_arrays,
+        collision_cache=collision_cache,
+    )
     if ball_linear_cushion_event.time < event.time:
         event = ball_linear_cushion_event
 
     ball_circular_cushion_event = get_next_ball_circular_cushion_event(
-        shot, solver=quartic_solver
+        shot,
+        solver=quartic_solver,
+        ball_arrays=ball_arrays,
+        table_arrays=table_arrays,
+        collision_cache=collision_cache,
     )
     if ball_circular_cushion_event.time < event.time:
         event = ball_circular_cushion_event
 
-    ball_pocket_event = get_next_ball_pocket_collision(shot, solver=quartic_solver)
+    ball_pocket_event = get_next_ball_pocket_collision(
+        shot,
+        solver=quartic_solver,
+        ball_arrays=ball_arrays,
+        table_arrays=table_arrays,
+        collision_cache=collision_cache,
+    )
     if ball_pocket_event.time < event.time:
         event = ball_pocket_event
 
@@ -259,6 +340,75 @@ class TransitionCache:
         )
 
 
+# Collisions between a ball and a table object
+_BALL_COLLISIONS: Tuple[EventType, ...] = (
+    EventType.BALL_LINEAR_CUSHION,
+    EventType.BALL_CIRCULAR_CUSHION,
+    EventType.BALL_POCKET,
+)
+
+
+@attrs.define
+class CollisionCache:
+    """Caches the collision times of each ball between events
+
+    A collision time depends only on the trajectories of the objects involved, so it
+    stays valid until one of the balls takes part in an event. Rather than searching for
+    every ball's collisions after each event, only the collisions of the balls involved
+    in the event are searched for again (see `invalidate`).
+
+    The times are absolute (the time of the collision, rather than the time until it),
+    so they remain correct as the system evolves.
+
+    Attributes:
+        index:
+            The index of each ball (keyed by ball ID) in the arrays below. This follows
+            the order of the system's balls.
+        times:
+            The collision times, keyed by the collision's event type. For ball-ball
+            collisions, this is an NxN array, where element (i, j) holds the time of the
+            collision between balls i and j (only elements with i < j are used). For
+            the other types, this is a length N array holding the time of each ball's
+            next collision with that type of object.
+        partners:
+            For collision types other than ball-ball, the ID of the object each ball
+            collides with next.
+        stale:
+            For each collision type, whether or not the collision times of each ball
+            need to be recalculated.
+    """
+
+    index: Dict[str, int]
+    times: Dict[EventType, NDArray[np.float64]]
+    partners: Dict[EventType, List[Optional[str]]]
+    stale: Dict[EventType, NDArray[np.bool_]]
+
+    def invalidate(self, event: Event) -> None:
+        """Mark the collision times of all balls in Event as stale"""
+        for agent in event.agents:
+            if agent.agent_type == AgentType.BALL:
+                i = self.index[agent.id]
+                for stale in self.stale.values():
+                    stale[i] = True
+
+    @classmethod
+    def create(cls, shot: System) -> CollisionCache:
+        n = len(shot.balls)
+
+        times = {event_type: np.full(n, np.inf) for event_type in _BALL_COLLISIONS}
+        times[EventType.BALL_BALL] = np.full((n, n), np.inf)
+
+        return cls(
+            index={ball_id: i for i, ball_id in enumerate(shot.balls)},
+            times=times,
+            partners={event_type: [None] * n for event_type in _BALL_COLLISIONS},
+            stale={
+                event_type: np.ones(n, dtype=np.bool_)
+                for event_type in (EventType.BALL_BALL, *_BALL_COLLISIONS)
+            },
+        )
+
+
 def _next_transition(ball: Ball) -> Event:
     if ball.state.s == const.stationary or ball.state.s == const.pocketed:
         return null_event(time=np.inf)
@@ -292,210 +442,276 @@ def _next_transition(ball: Ball) -> Event:
         raise NotImplementedError(f"Unknown '{ball.state.s=}'")
 
 
-def get_next_ball_ball_collision(
-    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
-) -> Event:
-    """Returns next ball-ball collision"""
+def _search_inputs(
+    shot: System,
+    ball_arrays: Optional[BallArrays],
+    table_arrays: Optional[TableArrays],
+    collision_cache: Optional[CollisionCache],
+) -> Tuple[BallArrays, TableArrays, CollisionCache]:
+    """Returns the inputs of the collision searches, building any that weren't passed"""
+    if ball_arrays is None:
+        ball_arrays = BallArrays.from_balls(tuple(shot.balls.values()))
 
-    dtau_E = np.inf
-    ball_ids = []
-    collision_coeffs = []
+    if table_arrays is None:
+        table_arrays = TableArrays.from_table(shot.table)
 
-    for ball1, ball2 in combinations(shot.balls.values(), 2):
-        ball1_state = ball1.state
-        ball1_params = ball1.params
+    if collision_cache is None:
+        collision_cache = CollisionCache.create(shot)
 
-        ball2_state = ball2.state
-        ball2_params = ball2.params
+    return ball_arrays, table_arrays, collision_cache
 
-        if ball1_state.s == const.pocketed or ball2_state.s == const.pocketed:
-            continue
 
-        if (
-            ball1_state.s in const.nontranslating
-            and ball2_state.s in const.nontranslating
-        ):
-            continue
+def get_next_ball_ball_collision(
+    shot: System,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+    ball_arrays: Optional[BallArrays] = None,
+    collision_cache: Optional[CollisionCache] = None,
+) -> Event:
+    """Returns next ball-ball collision
 
-        if (
-            math.norm3d(ball1_state.rvw[0] - ball2_state.rvw[0])
-            < ball1_params.R + ball2_params.R
-        ):
-            # If balls are intersecting, avoid internal collisions
-            continue
+    Args:
+        ball_arrays:
+            The shot's balls, stacked into arrays (see `BallArrays`), if available.
+        collision_cache:
+            Collision times from previous searches (see `CollisionCache`), if any.
+    """
 
-        collision_coeffs.append(
-            solve.ball_ball_collision_coeffs(
-                rvw1=ball1_state.rvw,
-                rvw2=ball2_state.rvw,
-                s1=ball1_state.s,
-                s2=ball2_state.s,
-                mu1=(
-                    ball1_params.u_s
-                    if ball1_state.s == const.sliding
-                    else ball1_params.u_r
-                ),
-                mu2=(
-                    ball2_params.u_s
-                    if ball2_state.s == const.sliding
-                    else ball2_params.u_r
-                ),
-                m1=ball1_params.m,
-                m2=ball2_params.m,
-                g1=ball1_params.g,
-                g2=ball2_params.g,
-                R=ball1_params.R,
-            )
+    ball_arrays, _, collision_cache = _search_inputs(
+        shot, ball_arrays, None, collision_cache
+    )
+
+    balls = ball_arrays.balls
+    times = collision_cache.times[EventType.BALL_BALL]
+    stale = collision_cache.stale[EventType.BALL_BALL]
+
+    if stale.any():
+        collision_coeffs, pairs = solve.ball_ball_collision_coeffs_many(
+            rvws=ball_arrays.rvw,
+            s=ball_arrays.s,
+            mu=ball_arrays.mu,
+            m=ball_arrays.m,
+            g=ball_arrays.g,
+            R=ball_arrays.R,
+            stale=stale,
         )
 
-        ball_ids.append((ball1.id, ball2.id))
+        # Pairs with a stale ball that can't collide aren't returned, so start with inf
+        times[stale, :] = np.inf
+        times[:, stale] = np.inf
 
-    if not len(collision_coeffs):
-        # There are no collisions to test for
-        return ball_ball_collision(Ball.dummy(), Ball.dummy(), shot.t + dtau_E)
+        if len(collision_coeffs):
+            dtau_E = math.roots.quartic.minimum_quartic_roots(
+                ps=collision_coeffs, solver=solver
+            )
+            times[pairs[:, 0], pairs[:, 1]] = shot.t + dtau_E
 
-    dtau_E, index = math.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
-    )
+        stale[:] = False
 
-    ball1_id, ball2_id = ball_ids[index]
-    ball1, ball2 = shot.balls[ball1_id], shot.balls[ball2_id]
+    # The first minimum in row-major order, i.e. the first pair in
+    # `itertools.combinations` order
+    i, j = divmod(int(times.argmin()), len(balls))
 
-    return ball_ball_collision(ball1, ball2, shot.t + dtau_E)
+    if times[i, j] == np.inf:
+        return ball_ball_collision(_DUMMY_BALL, _DUMMY_BALL, np.inf)
+
+    return ball_ball_collision(balls[i], balls[j], float(times[i, j]))
 
 
 def get_next_ball_circular_cushion_event(
-    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
+    shot: System,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+    ball_arrays: Optional[BallArrays] = None,
+    table_arrays: Optional[TableArrays] = None,
+    collision_cache: Optional[CollisionCache] = None,
 ) -> Event:
-    """Returns next ball-cushion collision (circular cushion segment)"""
+    """Returns next ball-cushion collision (circular cushion segment)
 
-    dtau_E = np.inf
-    agent_ids = []
-    collision_coeffs = []
+    Args:
+        ball_arrays:
+            The shot's balls, stacked into arrays (see `BallArrays`), if available.
+        table_arrays:
+            The shot's table, stacked into arrays (see `TableArrays`), if available.
+        collision_cache:
+            Collision times from previous searches (see `CollisionCache`), if any.
+    """
 
-    for ball in shot.balls.values():
-        if ball.state.s in const.nontranslating:
-            continue
+    ball_arrays, table_arrays, collision_cache = _search_inputs(
+        shot, ball_arrays, table_arrays, collision_cache
+    )
 
-        state = ball.state
-        params = ball.params
+    balls = ball_arrays.balls
+    times = collision_cache.times[EventType.BALL_CIRCULAR_CUSHION]
+    partners = collision_cache.partners[EventType.BALL_CIRCULAR_CUSHION]
+    stale = collision_cache.stale[EventType.BALL_CIRCULAR_CUSHION]
+
+    if stale.any():
+        cushions = table_arrays.circular
+
+        collision_coeffs, indices = solve.ball_circle_collision_coeffs_many(
+            rvws=ball_arrays.rvw,
+            s=ball_arrays.s,
+            mu=ball_arrays.mu,
+            m=ball_arrays.m,
+            g=ball_arrays.g,
+            R=ball_arrays.R,
+            stale=stale,
+            a=cushions.a,
+            b=cushions.b,
+            r=cushions.r,
+            pockets=False,
+        )
 
-        for cushion in shot.table.cushion_segments.circular.values():
-            collision_coeffs.append(
-                solve.ball_circular_cushion_collision_coeffs(
-                    rvw=state.rvw,
-                    s=state.s,
-                    a=cushion.a,
-                    b=cushion.b,
-                    r=cushion.radius,
-                    mu=(params.u_s if state.s == const.sliding else params.u_r),
-                    m=params.m,
-                    g=params.g,
-                    R=params.R,
-                )
-            )
+        times[stale] = np.inf
+
+        if len(collision_coeffs):
+            dtau_E = math.roots.quartic.minimum_quartic_roots(
+                ps=collision_coeffs, solver=solver
+            ).reshape(len(indices), len(cushions.ids))
 
-            agent_ids.append((ball.id, cushion.id))
+            times[indices] = shot.t + dtau_E.min(axis=1)
+            for i, index in zip(indices.tolist(), dtau_E.argmin(axis=1).tolist()):
+                partners[i] = cushions.ids[index]
 
-    if not len(collision_coeffs):
-        # There are no collisions to test for
+        stale[:] = False
+
+    i = int(times.argmin())
+
+    if times[i] == np.inf:
         return ball_circular_cushion_collision(
-            Ball.dummy(), CircularCushionSegment.dummy(), shot.t + dtau_E
+            _DUMMY_BALL, _DUMMY_CIRCULAR_CUSHION, np.inf
         )
 
-    dtau_E, index = math.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
-    )
+    assert (cushion_id := partners[i]) is not None
+    cushion = shot.table.cushion_segments.circular[cushion_id]
 
-    ball_id, cushion_id = agent_ids[index]
-    ball, cushion = (
-        shot.balls[ball_id],
-        shot.table.cushion_segments.circular[cushion_id],
-    )
+    return ball_circular_cushion_collision(balls[i], cushion, float(times[i]))
 
-    return ball_circular_cushion_collision(ball, cushion, shot.t + dtau_E)
 
+def get_next_ball_linear_cushion_collision(
+    shot: System,
+    ball_arrays: Optional[BallArrays] = None,
+    table_arrays: Optional[TableArrays] = None,
+    collision_cache: Optional[CollisionCache] = None,
+) -> Event:
+    """Returns next ball-cushion collision (linear cushion segment)
 
-def get_next_ball_linear_cushion_collision(shot: System) -> Event:
-    """Returns next ball-cushion collision (linear cushion segment)"""
+    Args:
+        ball_arrays:
+            The shot's balls, stacked into arrays (see `BallArrays`), if available.
+        table_arrays:
+            The shot's table, stacked into arrays (see `TableArrays`), if available.
+        collision_cache:
+            Collision times from previous searches (see `CollisionCache`), if any.
+    """
 
-    dtau_E_min = np.inf
-    involved_agents = (Ball.dummy(), LinearCushionSegment.dummy())
+    ball_arrays, table_arrays, collision_cache = _search_inputs(
+        shot, ball_arrays, table_arrays, collision_cache
+    )
 
-    for ball in shot.balls.values():
-        if ball.state.s in const.nontranslating:
-            continue
+    balls = ball_arrays.balls
+    times = collision_cache.times[EventType.BALL_LINEAR_CUSHION]
+    partners = collision_cache.partners[EventType.BALL_LINEAR_CUSHION]
+    stale = collision_cache.stale[EventType.BALL_LINEAR_CUSHION]
+
+    if stale.any():
+        cushions = table_arrays.linear
+
+        dtau_E, indices = solve.ball_linear_cushions_collision_times(
+            rvws=ball_arrays.rvw,
+            s=ball_arrays.s,
+            mu=ball_arrays.mu,
+            m=ball_arrays.m,
+            g=ball_arrays.g,
+            R=ball_arrays.R,
+            stale=stale,
+            lx=cushions.lx,
+            ly=cushions.ly,
+            l0=cushions.l0,
+            p1=cushions.p1,
+            p2=cushions.p2,
+            direction=cushions.direction,
+        )
 
-        state = ball.state
-        params = ball.params
+        times[stale] = shot.t + dtau_E[stale]
+        for i in np.flatnonzero(indices > -1).tolist():
+            partners[i] = cushions.ids[indices[i]]
 
-        for cushion in shot.table.cushion_segments.linear.values():
-            dtau_E = solve.ball_linear_cushion_collision_time(
-                rvw=state.rvw,
-                s=state.s,
-                lx=cushion.lx,
-                ly=cushion.ly,
-                l0=cushion.l0,
-                p1=cushion.p1,
-                p2=cushion.p2,
-                direction=cushion.direction,
-                mu=(params.u_s if state.s == const.sliding else params.u_r),
-                m=params.m,
-                g=params.g,
-                R=params.R,
-            )
+        stale[:] = False
 
-            if dtau_E < dtau_E_min:
-                involved_agents = (ball, cushion)
-                dtau_E_min = dtau_E
+    i = int(times.argmin())
 
-    dtau_E = dtau_E_min
+    if times[i] == np.inf:
+        return ball_linear_cushion_collision(_DUMMY_BALL, _DUMMY_LINEAR_CUSHION, np.inf)
 
-    return ball_linear_cushion_collision(*involved_agents, shot.t + dtau_E)
+    assert (cushion_id := partners[i]) is not None
+    cushion = shot.table.cushion_segments.linear[cushion_id]
+
+    return ball_linear_cushion_collision(balls[i], cushion, float(times[i]))
 
 
 def get_next_ball_pocket_collision(
-    shot: System, solver: QuarticSolver = QuarticSolver.HYBRID
+    shot: System,
+    solver: QuarticSolver = QuarticSolver.HYBRID,
+    ball_arrays: Optional[BallArrays] = None,
+    table_arrays: Optional[TableArrays] = None,
+    collision_cache: Optional[CollisionCache] = None,
 ) -> Event:
-    """Returns next ball-pocket collision"""
+    """Returns next ball-pocket collision
 
-    dtau_E = np.inf
-    agent_ids = []
-    collision_coeffs = []
+    Args:
+        ball_arrays:
+            The shot's balls, stacked into arrays (see `BallArrays`), if available.
+        table_arrays:
+            The shot's table, stacked into arrays (see `TableArrays`), if available.
+        collision_cache:
+            Collision times from previous searches (see `CollisionCache`), if any.
+    """
 
-    for ball in shot.balls.values():
-        if ball.state.s in const.nontranslating:
-            continue
+    ball_arrays, table_arrays, collision_cache = _search_inputs(
+        shot, ball_arrays, table_arrays, collision_cache
+    )
 
-        state = ball.state
-        params = ball.params
+    balls = ball_arrays.balls
+    times = collision_cache.times[EventType.BALL_POCKET]
+    partners = collision_cache.partners[EventType.BALL_POCKET]
+    stale = collision_cache.stale[EventType.BALL_POCKET]
+
+    if stale.any():
+        pockets = table_arrays.pockets
+
+        collision_coeffs, indices = solve.ball_circle_collision_coeffs_many(
+            rvws=ball_arrays.rvw,
+            s=ball_arrays.s,
+            mu=ball_arrays.mu,
+            m=ball_arrays.m,
+            g=ball_arrays.g,
+            R=ball_arrays.R,
+            stale=stale,
+            a=pockets.a,
+            b=pockets.b,
+            r=pockets.r,
+            pockets=True,
+        )
 
-        for pocket in shot.table.pockets.values():
-            collision_coeffs.append(
-                solve.ball_pocket_collision_coeffs(
-                    rvw=state.rvw,
-                    s=state.s,
-                    a=pocket.a,
-                    b=pocket.b,
-                    r=pocket.radius,
-                    mu=(params.u_s if state.s == const.sliding else params.u_r),
-                    m=params.m,
-                    g=params.g,
-                    R=params.R,
-                )
-            )
+        times[stale] = np.inf
 
-            agent_ids.append((ball.id, pocket.id))
+        if len(collision_coeffs):
+            dtau_E = math.roots.quartic.minimum_quartic_roots(
+                ps=collision_coeffs, solver=solver
+            ).reshape(len(indices), len(pockets.ids))
 
-    if not len(collision_coeffs):
-        # There are no collisions to test for
-        return ball_pocket_collision(Ball.dummy(), Pocket.dummy(), shot.t + dtau_E)
+            times[indices] = shot.t + dtau_E.min(axis=1)
+            for i, index in zip(indices.tolist(), dtau_E.argmin(axis=1).tolist()):
+                partners[i] = pockets.ids[index]
 
-    dtau_E, index = math.roots.quartic.minimum_quartic_root(
-        ps=np.array(collision_coeffs), solver=solver
-    )
+        stale[:] = False
+
+    i = int(times.argmin())
+
+    if times[i] == np.inf:
+        return ball_pocket_collision(_DUMMY_BALL, _DUMMY_POCKET, np.inf)
 
-    ball_id, pocket_id = agent_ids[index]
-    ball, pocket = shot.balls[ball_id], shot.table.pockets[pocket_id]
+    assert (pocket_id := partners[i]) is not None
+    pocket = shot.table.pockets[pocket_id]
 
-    return ball_pocket_collision(ball, pocket, shot.t + dtau_E)
+    return ball_pocket_collision(balls[i], pocket, float(times[i]))
@@ -201,6 +201,102 @@ def skip_ball_linear_cushion_collision(rvw, s, u_r, g, R, p1, p2, normal):
     return False
 
 
+@jit(nopython=True, cache=const.numba_cache)
+def _is_translating(s):
+    return s == const.sliding or s == const.rolling
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def _max_travel(rvw, s, mu, g, R):
+    """An upper bound on a ball's displacement before its next motion transition"""
+    if s == const.sliding:
+        t = physics_utils.get_slide_time(rvw, R, mu, g)
+        # The friction can also speed the ball up, so assume it does
+        return math.norm3d(rvw[1]) * t + 0.5 * mu * g * t**2
+    elif s == const.rolling:
+        # The ball decelerates until it stops rolling
+        return math.norm3d(rvw[1]) * physics_utils.get_roll_time(rvw, mu, g)
+    else:
+        return 0.0
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def ball_ball_collision_coeffs_many(rvws, s, mu, m, g, R, stale):
+    """Get quartic coeffs for every pair of balls that could collide
+
+    The ball arguments are arrays, with one element (or (3, 3) block, for rvws) per
+    ball. Pairs are skipped if neither ball is stale (stale is a boolean array), if
+    either ball is pocketed, if neither ball is translating, or if the balls are
+    intersecting. See `ball_ball_collision_coeffs`.
+
+    Pairs are also skipped if the balls are too far apart to make contact before one of
+    them transitions to a new motion state. The trajectories behind a collision time
+    found beyond that point are invalid, and in any case the transition event happens
+    first.
+
+    (just-in-time compiled)
+
+    Returns:
+        (coeffs, pairs):
+            coeffs is a kx5 array of quartic coefficients, one row per pair that could
+            collide. pairs is a kx2 array of the indices of the balls in each pair.
+            Pairs are ordered like `itertools.combinations`.
+    """
+    n = len(s)
+    coeffs = np.empty((n * (n - 1) // 2, 5), dtype=np.float64)
+    pairs = np.empty((n * (n - 1) // 2, 2), dtype=np.int64)
+
+    reach = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        reach[i] = _max_travel(rvws[i], s[i], mu[i], g[i], R[i])
+
+    k = 0
+    for i in range(n):
+        for j in range(i + 1, n):
+            if not stale[i] and not stale[j]:
+                continue
+
+            if s[i] == const.pocketed or s[j] == const.pocketed:
+                continue
+
+            if not _is_translating(s[i]) and not _is_translating(s[j]):
+                continue
+
+            distance = math.norm3d(rvws[i, 0] - rvws[j, 0])
+
+            if distance < R[i] + R[j]:
+                # If balls are intersecting, avoid internal collisions
+                continue
+
+            if distance - (R[i] + R[j]) > reach[i] + reach[j] + const.EPS_SPACE:
+                # The balls can't reach each other
+                continue
+
+            a, b, c, d, e = ball_ball_collision_coeffs(
+                rvw1=rvws[i],
+                rvw2=rvws[j],
+                s1=s[i],
+                s2=s[j],
+                mu1=mu[i],
+                mu2=mu[j],
+                m1=m[i],
+                m2=m[j],
+                g1=g[i],
+                g2=g[j],
+                R=R[i],
+            )
+            coeffs[k, 0] = a
+            coeffs[k, 1] = b
+            coeffs[k, 2] = c
+            coeffs[k, 3] = d
+            coeffs[k, 4] = e
+            pairs[k, 0] = i
+            pairs[k, 1] = j
+            k += 1
+
+    return coeffs[:k], pairs[:k]
+
+
 @jit(nopython=True, cache=const.numba_cache)
 def ball_linear_cushion_collision_time(
     rvw, s, lx, ly, l0, p1, p2, direction, mu, m, g, R
@@ -264,6 +360,70 @@ def ball_linear_cushion_collision_time(
     return min_time
 
 
+@jit(nopython=True, cache=const.numba_cache)
+def ball_linear_cushions_collision_time(
+    rvw, s, lx, ly, l0, p1, p2, direction, mu, m, g, R
+):
+    """Get time until collision between ball and the soonest of many linear cushions
+
+    The cushion arguments are arrays, with one element (or row, for p1 and p2) per
+    cushion segment. See `ball_linear_cushion_collision_time`.
+
+    (just-in-time compiled)
+
+    Returns:
+        The collision time and the index of the cushion segment. If no collision
+        occurs, the time is infinite and the index is -1.
+    """
+    min_time = np.inf
+    index = -1
+
+    for i in range(len(lx)):
+        dtau_E = ball_linear_cushion_collision_time(
+            rvw, s, lx[i], ly[i], l0[i], p1[i], p2[i], direction[i], mu, m, g, R
+        )
+
+        if dtau_E < min_time:
+            min_time = dtau_E
+            index = i
+
+    return min_time, index
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def ball_linear_cushions_collision_times(
+    rvws, s, mu, m, g, R, stale, lx, ly, l0, p1, p2, direction
+):
+    """Get time until each ball collides with the soonest of many linear cushions
+
+    The ball arguments are arrays, with one element (or (3, 3) block, for rvws) per
+    ball, and so are the cushion arguments (see `ball_linear_cushions_collision_time`).
+    Balls are skipped if they aren't stale (stale is a boolean array) or aren't
+    translating.
+
+    (just-in-time compiled)
+
+    Returns:
+        (times, indices):
+            The collision time of each ball, and the index of the cushion segment it
+            collides with. For skipped balls, and balls that don't collide, the time is
+            infinite and the index is -1.
+    """
+    n = len(s)
+    times = np.full(n, np.inf)
+    indices = np.full(n, -1, dtype=np.int64)
+
+    for i in range(n):
+        if not stale[i] or not _is_translating(s[i]):
+            continue
+
+        times[i], indices[i] = ball_linear_cushions_collision_time(
+            rvws[i], s[i], lx, ly, l0, p1, p2, direction, mu[i], m[i], g[i], R[i]
+        )
+
+    return times, indices
+
+
 @jit(nopython=True, cache=const.numba_cache)
 def ball_circular_cushion_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     """Get quartic coeffs required to determine the ball-circular-cushion collision time
@@ -328,3 +488,61 @@ def ball_pocket_collision_coeffs(rvw, s, a, b, r, mu, m, g, R):
     E = 0.5 * (a**2 + b**2 + cx**2 + cy**2 - r**2) - (cx * a + cy * b)
 
     return A, B, C, D, E
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def _stale_and_translating(stale, s):
+    """The indices of the balls that are stale and translating"""
+    indices = np.empty(len(s), dtype=np.int64)
+
+    k = 0
+    for i in range(len(s)):
+        if stale[i] and _is_translating(s[i]):
+            indices[k] = i
+            k += 1
+
+    return indices[:k]
+
+
+@jit(nopython=True, cache=const.numba_cache)
+def ball_circle_collision_coeffs_many(rvws, s, mu, m, g, R, stale, a, b, r, pockets):
+    """Get quartic coeffs for every stale ball and circle
+
+    The circles are either circular cushion segments or, if pockets is True,
+    pockets (see `ball_circular_cushion_collision_coeffs` and
+    `ball_pocket_collision_coeffs`). The ball arguments are arrays, with one element
+    (or (3, 3) block, for rvws) per ball, and so are the circle arguments. Balls are
+    skipped if they aren't stale (stale is a boolean array) or aren't translating.
+
+    (just-in-time compiled)
+
+    Returns:
+        (coeffs, indices):
+            indices is an array of the k balls that weren't skipped. coeffs is a
+            (k * n)x5 array of quartic coefficients, where n is the number of
+            circles. The rows are ordered by ball, then by circle, so
+            coeffs.reshape(k, n, 5)[i, j] holds the coefficients of ball indices[i] and
+            circle j.
+    """
+    indices = _stale_and_translating(stale, s)
+    coeffs = np.empty((len(indices) * len(a), 5), dtype=np.float64)
+
+    row = 0
+    for i in indices:
+        for j in range(len(a)):
+            if pockets:
+                A, B, C, D, E = ball_pocket_collision_coeffs(
+                    rvws[i], s[i], a[j], b[j], r[j], mu[i], m[i], g[i], R[i]
+                )
+            else:
+                A, B, C, D, E = ball_circular_cushion_collision_coeffs(
+                    rvws[i], s[i], a[j], b[j], r[j], mu[i], m[i], g[i], R[i]
+                )
+            coeffs[row, 0] = A
+            coeffs[row, 1] = B
+            coeffs[row, 2] = C
+            coeffs[row, 3] = D
+            coeffs[row, 4] = E
+            row += 1
+
+    return coeffs, indices
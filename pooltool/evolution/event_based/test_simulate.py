@@ -5,16 +5,27 @@ from numpy.typing import NDArray
 import pooltool.constants as const
 import pooltool.math as math
 import pooltool.physics.utils as physics_utils
-from pooltool.events import EventType, ball_ball_collision, ball_pocket_collision
+from pooltool.events import (
+    AgentType,
+    EventType,
+    ball_ball_collision,
+    ball_pocket_collision,
+    filter_type,
+    stick_ball_collision,
+)
 from pooltool.evolution.event_based.simulate import (
+    CollisionCache,
+    _evolve,
     get_next_ball_ball_collision,
     get_next_event,
     simulate,
 )
 from pooltool.evolution.event_based.solve import ball_ball_collision_coeffs
 from pooltool.evolution.event_based.test_data import TEST_DIR
+from pooltool.layouts import get_nine_ball_rack
 from pooltool.math.roots import quadratic, quartic
 from pooltool.objects import Ball, BilliardTableSpecs, Cue, Table
+from pooltool.physics.engine import PhysicsEngine
 from pooltool.system import System
 
 
@@ -46,6 +57,20 @@ def test_simulate_inplace():
     assert system is simulated_system
 
 
+def test_simulate_after_table_change():
+    system = System.example()
+    simulate(system, inplace=True)
+
+    # Remove the linear cushions, then simulate the same system again
+    system.reset_history()
+    system.reset_balls()
+    system.table.cushion_segments.linear.clear()
+    simulate(system, inplace=True)
+
+    # The second simulation doesn't see the removed cushions
+    assert not filter_type(system.events, EventType.BALL_LINEAR_CUSHION)
+
+
 def test_simulate_continuize():
     system = System.example()
     simulate(system, inplace=True, continuous=False)
@@ -480,3 +505,127 @@ def test_no_ball_ball_collisions_for_intersecting_balls(solver: quartic.QuarticS
         get_next_event(system, quartic_solver=solver).event_type != EventType.BALL_BALL
     )
     assert get_next_ball_ball_collision(system, solver=solver).time == np.inf
+
+
+@pytest.mark.parametrize(
+    "solver", [quartic.QuarticSolver.NUMERIC, quartic.QuarticSolver.HYBRID]
+)
+@pytest.mark.parametrize("separation, collides", [(1.0, True), (3.0, False)])
+def test_ball_ball_collision_out_of_reach(
+    solver: quartic.QuarticSolver, separation: float, collides: bool
+):
+    """A ball that stops before reaching another ball doesn't collide with it
+
+    The cue rolls towards the one ball with speed 0.5 m/s, stopping after roughly 1.28
+    m. So it reaches the ball 1 m away, but not the ball 3 m away.
+    """
+
+    system = System(
+        cue=Cue.default(),
+        table=(table := Table.from_table_specs(BilliardTableSpecs(l=10, w=10))),
+        balls={
+            "1": (ball := Ball.create("1", xy=(1, table.l / 2))),
+            "cue": Ball.create("cue", xy=(1 + separation, table.l / 2)),
+        },
+    )
+
+    v = np.array([-0.5, 0, 0])
+    w = math.cross(np.array([0, 0, 1]), v) / ball.params.R
+
+    system.balls["cue"].state.rvw[1] = v
+    system.balls["cue"].state.rvw[2] = w
+    system.balls["cue"].state.s = const.rolling
+
+    _assert_rolling(system.balls["cue"].state.rvw, system.balls["cue"].params.R)
+
+    event = get_next_ball_ball_collision(system, solver=solver)
+
+    if collides:
+        assert event.time < np.inf
+        assert {agent.id for agent in event.agents} == {"1", "cue"}
+    else:
+        assert event.time == np.inf
+
+
+def test_collision_cache():
+    """Searching only for the collisions of stale balls gives the same next event"""
+    table = Table.pocket_table()
+    system = System(
+        cue=Cue(cue_ball_id="cue"),
+        table=table,
+        balls=get_nine_ball_rack(table, ordered=True),
+    )
+    system.aim_at_ball("1")
+    system.strike(V0=5)
+
+    engine = PhysicsEngine()
+    event = stick_ball_collision(system.cue, system.balls["cue"], 0, set_initial=True)
+    engine.resolver.resolve(system, event)
+
+    collision_cache = CollisionCache.create(system)
+
+    for _ in range(30):
+        event = get_next_event(system, collision_cache=collision_cache)
+        uncached_event = get_next_event(system)
+
+        assert event.event_type == uncached_event.event_type
+        assert event.ids == uncached_event.ids
+        assert event.time == pytest.approx(uncached_event.time, abs=1e-9)
+
+        # The searches leave nothing stale
+        for stale in collision_cache.stale.values():
+            assert not stale.any()
+
+        _evolve(system, event.time - system.t)
+        engine.resolver.resolve(system, event)
+        system.update_history(event)
+        collision_cache.invalidate(event)
+
+        # Only the event's balls are stale
+        stale_ids = {
+            ball_id
+            for ball_id, i in collision_cache.index.items()
+            if collision_cache.stale[EventType.BALL_BALL][i]
+        }
+        assert stale_ids == {
+            agent.id for agent in event.agents if agent.agent_type == AgentType.BALL
+        }
+
+
+def test_reference_shot():
+    """The event sequence and final state of a reference shot don't change
+
+    The reference shot is a nine-ball break. Because collision times are cached (see
+    `CollisionCache`), they are calculated from the state each ball had at its last
+    event, rather than from the current state. The round-off error this introduces is
+    amplified by the break: compared with searching every ball after each event, this
+    shot's event times move by up to 7e-5 s and the final ball positions by up to 2e-5
+    m, though the event sequence is the same. In other shots, near-simultaneous events
+    can swap order.
+
+    These results are accepted, and pinned here to a much tighter tolerance, so that
+    any later change to them is deliberate.
+    """
+    reference = System.load(TEST_DIR / "nine_ball_break.msgpack")
+
+    shot = reference.copy()
+    for ball in shot.balls.values():
+        ball.state = ball.history[0]
+    shot.reset_history()
+
+    simulate(shot, inplace=True)
+
+    assert [event.event_type for event in shot.events] == [
+        event.event_type for event in reference.events
+    ]
+    assert [event.ids for event in shot.events] == [
+        event.ids for event in reference.events
+    ]
+    assert [event.time for event in shot.events] == pytest.approx(
+        [event.time for event in reference.events], abs=1e-6
+    )
+
+    for ball_id, ball in shot.balls.items():
+        expected = reference.balls[ball_id].state
+        assert ball.state.s == expected.s
+        assert ball.state.rvw == pytest.approx(expected.rvw, abs=1e-6)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from pooltool.evolution.continuize import continuize
 from pooltool.evolution.event_based.simulate import simulate
 from pooltool.system import System
@@ -30,3 +32,23 @@ def test_continuize_inplace():
 
     # They are the same object
     assert continuized_system is system
+
+
+def test_continuize_timestamps():
+    system = continuize(simulate(System.example()), dt=0.01)
+    num_timestamps = int(system.events[-1].time // 0.01) + 1
+
+    for ball in system.balls.values():
+        history = ball.history_cts
+
+        # One state per timestamp, plus the final state
+        assert len(history) == num_timestamps + 1
+
+        # The first and last states are those of the event-based history
+        assert history[0] is ball.history[0]
+        assert history[-1] is ball.history[-1]
+
+        # All timestamps but the last are spaced dt apart
+        times = [state.t for state in history.states]
+        assert np.allclose(np.diff(times[:-1]), 0.01)
+        assert 0 <= times[-1] - times[-2] < 0.01
@@ -42,6 +42,46 @@ def min_real_root(
             datatype is returned, and it may have residual complex components. Use
             root.real for only the real component.
     """
+    candidates = roots[_is_real_and_positive(roots, abs_or_rel_cutoff, rtol, atol)]
+
+    if candidates.size == 0:
+        return np.complex128(np.inf)
+
+    # Return candidate with the smallest real component
+    return candidates[candidates.real.argmin()]
+
+
+def min_real_roots(
+    roots: NDArray[np.complex128],
+    abs_or_rel_cutoff: float = 1e-3,
+    rtol: float = 1e-3,
+    atol: float = 1e-9,
+) -> NDArray[np.float64]:
+    """Find the minimum, real, positive root of each row in a 2D array of roots
+
+    This is the row-wise equivalent of `min_real_root`, and accepts the same keyword
+    arguments.
+
+    Args:
+        roots:
+            A 2D array of roots, where each row holds the roots of one polynomial.
+
+    Returns:
+        roots:
+            The real component of each row's smallest, real, positive root. Rows without
+            such a root are assigned np.inf.
+    """
+    keep = _is_real_and_positive(roots, abs_or_rel_cutoff, rtol, atol)
+    return np.where(keep, roots.real, np.inf).min(axis=1)
+
+
+def _is_real_and_positive(
+    roots: NDArray[np.complex128],
+    abs_or_rel_cutoff: float,
+    rtol: float,
+    atol: float,
+) -> NDArray[np.bool_]:
+    """Which roots are real and positive (see `min_real_root` for the criteria)"""
     positive = roots.real >= 0.0
 
     imag_mag = np.abs(roots.imag)
@@ -55,13 +95,7 @@ def min_real_root(
     small_keep2 = (real_mag == 0) & (imag_mag == 0)
     small_keep = (small_keep1 | small_keep2) & positive
 
-    candidates = roots[(small & small_keep) | (big & big_keep)]
-
-    if candidates.size == 0:
-        return np.complex128(np.inf)
-
-    # Return candidate with the smallest real component
-    return candidates[candidates.real.argmin()]
+    return (small & small_keep) | (big & big_keep)
 
 
 @jit(nopython=True, cache=const.numba_cache)
@@ -5,7 +5,11 @@ from numba import jit
 from numpy.typing import NDArray
 
 import pooltool.constants as const
-from pooltool.math.roots.core import find_first_row_with_value, min_real_root
+from pooltool.math.roots.core import (
+    find_first_row_with_value,
+    min_real_root,
+    min_real_roots,
+)
 from pooltool.utils.strenum import StrEnum, auto
 
 
@@ -49,6 +53,31 @@ def minimum_quartic_root(
     return float(best_root.real), index
 
 
+def minimum_quartic_roots(
+    ps: NDArray[np.float64], solver: QuarticSolver = QuarticSolver.HYBRID
+) -> NDArray[np.float64]:
+    """Solves an array of quartic coefficients, returns the minimum root of each one
+
+    Unlike `minimum_quartic_root`, which returns the smallest root of all the
+    polynomials, this returns the smallest root of each polynomial.
+
+    Args:
+        ps:
+            A mx5 array of polynomial coefficients, where m is the number of equations.
+            See `minimum_quartic_root`.
+        solver:
+            The method used to calculate the roots. See
+            pooltool.math.roots.quartic.QuarticSolver.
+
+    Returns:
+        real_roots:
+            A length m array of the minimum real root of each polynomial. Polynomials
+            without a real, positive root are assigned np.inf.
+    """
+    assert QuarticSolver(solver)
+    return min_real_roots(_quartic_routine[solver](ps))
+
+
 def solve_many_numerical(p):
     """Solve multiple polynomial equations using companion matrix eigenvalues
 
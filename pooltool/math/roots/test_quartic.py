@@ -34,3 +34,37 @@ def test_e_equals_0():
 
     expected = np.zeros(4, dtype=np.complex128)
     assert (expected == quartic.solve(*coeffs)).all()
+
+
+@pytest.mark.parametrize(
+    "solver", [quartic.QuarticSolver.NUMERIC, quartic.QuarticSolver.HYBRID]
+)
+def test_minimum_quartic_roots(solver: quartic.QuarticSolver):
+    coeffs_array = np.array(
+        [
+            # Real root at ~0.0489 (see test_case1)
+            [
+                0.9604000000000001,
+                -22.342459712735774,
+                131.1430067191817,
+                -13.968966072700297,
+                0.37215503307938314,
+            ],
+            # No real roots: (t^2 + 1)^2
+            [1.0, 0.0, 2.0, 0.0, 1.0],
+            # Roots at 1, 2, 3, 4
+            [1.0, -10.0, 35.0, -50.0, 24.0],
+        ]
+    )
+
+    roots = quartic.minimum_quartic_roots(coeffs_array, solver)
+
+    assert roots.shape == (3,)
+    assert roots[0] == pytest.approx(0.048943195217641386, rel=1e-4)
+    assert roots[1] == np.inf
+    assert roots[2] == pytest.approx(1.0)
+
+    # The smallest of the roots is the one found by minimum_quartic_root
+    root, index = quartic.minimum_quartic_root(coeffs_array, solver)
+    assert roots.min() == root
+    assert roots.argmin() == index
@@ -162,27 +162,21 @@ class BallHistory:
 
     def copy(self) -> BallHistory:
         """Create a deep copy"""
-        history = BallHistory()
-        for state in self.states:
-            history.add(state.copy())
-
-        return history
+        # The states are already in time order, so there's no need to validate each one
+        # with `add`
+        return BallHistory(states=[state.copy() for state in self.states])
 
     def vectorize(self) -> Optional[Tuple[F64Array, F64Array, F64Array]]:
         """Return rvw, s, and t as arrays"""
         if self.empty:
             return None
 
-        num_states = len(self.states)
-
-        rvws = np.empty((num_states, 3, 3), dtype=np.float64)
-        ss = np.empty(num_states, dtype=np.float64)
-        ts = np.empty(num_states, dtype=np.float64)
-
-        for idx, state in enumerate(self.states):
-            rvws[idx] = state.rvw
-            ss[idx] = state.s
-            ts[idx] = state.t
+        # Each array is built from a list in one call, which is faster than assigning
+        # into preallocated arrays state by state
+        states = self.states
+        rvws = np.array([state.rvw for state in states], dtype=np.float64)
+        ss = np.array([state.s for state in states], dtype=np.float64)
+        ts = np.array([state.t for state in states], dtype=np.float64)
 
         return rvws, ss, ts
 
@@ -272,3 +266,76 @@ class Ball:
     @staticmethod
     def dummy(id: str = "dummy") -> Ball:
         return Ball(id=id)
+
+
+@define(frozen=True)
+class BallArrays:
+    """The states and parameters of a collection of balls, stacked into arrays
+
+    Element i of each array describes the ball `balls[i]`. Storing the balls this way
+    lets them all be passed to a numba-compiled function at once, rather than calling
+    it once per ball. The table's objects are stored the same way (see
+    `LinearCushionArrays` and `CircleArrays`).
+
+    The arrays are copies, so this is a snapshot of the balls at the time of creation.
+    """
+
+    balls: Tuple[Ball, ...]
+    rvw: NDArray[np.float64]
+    s: NDArray[np.int64]
+    m: NDArray[np.float64]
+    R: NDArray[np.float64]
+    u_s: NDArray[np.float64]
+    u_r: NDArray[np.float64]
+    g: NDArray[np.float64]
+
+    # The coefficient of friction that governs each ball's current motion
+    mu: NDArray[np.float64]
+
+    def with_current_states(self) -> BallArrays:
+        """Return a snapshot of the balls' current states
+
+        Only the states are gathered again. The parameter arrays are shared with this
+        object, so the balls' parameters must not have changed since it was created.
+        """
+        rvw, s = _stack_states(self.balls)
+
+        return BallArrays(
+            balls=self.balls,
+            rvw=rvw,
+            s=s,
+            m=self.m,
+            R=self.R,
+            u_s=self.u_s,
+            u_r=self.u_r,
+            g=self.g,
+            mu=np.where(s == c.sliding, self.u_s, self.u_r),
+        )
+
+    @staticmethod
+    def from_balls(balls: Sequence[Ball]) -> BallArrays:
+        rvw, s = _stack_states(balls)
+        params = [ball.params for ball in balls]
+
+        u_s = np.array([p.u_s for p in params], dtype=np.float64)
+        u_r = np.array([p.u_r for p in params], dtype=np.float64)
+
+        return BallArrays(
+            balls=tuple(balls),
+            rvw=rvw,
+            s=s,
+            m=np.array([p.m for p in params], dtype=np.float64),
+            R=np.array([p.R for p in params], dtype=np.float64),
+            u_s=u_s,
+            u_r=u_r,
+            g=np.array([p.g for p in params], dtype=np.float64),
+            mu=np.where(s == c.sliding, u_s, u_r),
+        )
+
+
+def _stack_states(
+    balls: Sequence[Ball],
+) -> Tuple[NDArray[np.float64], NDArray[np.int64]]:
+    states = [ball.state for ball in balls]
+    rvw = np.array([s.rvw for s in states], dtype=np.float64).reshape(-1, 3, 3)
+    return rvw, np.array([s.s for s in states], dtype=np.int64)
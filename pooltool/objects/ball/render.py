@@ -163,13 +163,15 @@ class BallRender(Render):
         quat : length-4 iterable
         """
 
-        self.nodes["pos"].setPos(*pos)
-        self.nodes["shadow"].setPos(
-            pos[0], pos[1], min(0, pos[2] - self._ball.params.R)
-        )
+        # Unpacking to python floats is cheaper than passing numpy scalars to Panda3D
+        x, y, z = pos.tolist() if isinstance(pos, np.ndarray) else pos
 
         if quat is not None:
-            self.nodes["pos"].setQuat(quat)
+            self.nodes["pos"].setPosQuat((x, y, z), quat)
+        else:
+            self.nodes["pos"].setPos(x, y, z)
+
+        self.nodes["shadow"].setPos(x, y, min(0, z - self._ball.params.R))
 
     def set_render_state_from_history(self, ball_history: BallHistory, i: int):
         """Set the position of the rendered ball based on history index
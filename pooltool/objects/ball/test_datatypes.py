@@ -3,9 +3,10 @@ import numpy as np
 import pytest
 from attrs.exceptions import FrozenInstanceError
 
-from pooltool.constants import stationary
+from pooltool.constants import rolling, sliding, stationary
 from pooltool.objects.ball.datatypes import (
     Ball,
+    BallArrays,
     BallHistory,
     BallOrientation,
     BallParams,
@@ -212,3 +213,36 @@ def test_ball_copy():
     assert ball.state == copy.state
     ball.state.rvw[0] = [1, 1, 1]
     assert ball.state != copy.state
+
+
+def test_ball_arrays():
+    ball1 = Ball.create("1", xy=(0.2, 0.3), u_s=0.3)
+    ball2 = Ball.create("2", xy=(0.5, 0.6), R=0.03)
+    ball2.state.s = sliding
+
+    arrays = BallArrays.from_balls((ball1, ball2))
+
+    assert arrays.balls == (ball1, ball2)
+    assert arrays.rvw.shape == (2, 3, 3)
+    assert np.array_equal(arrays.rvw[1], ball2.state.rvw)
+    assert arrays.s.tolist() == [stationary, sliding]
+    assert arrays.R.tolist() == [ball1.params.R, 0.03]
+
+    # The sliding ball is governed by sliding friction, the other by rolling friction
+    assert arrays.mu.tolist() == [ball1.params.u_r, ball2.params.u_s]
+
+    # The arrays are a snapshot, not views of the balls' states
+    ball1.state.rvw[0] = [0.4, 0.4, ball1.params.R]
+    assert arrays.rvw[0, 0, 0] == 0.2
+
+    # Gathering the current states shares the parameters
+    ball2.state.s = rolling
+    current = arrays.with_current_states()
+    assert current.rvw[0, 0, 0] == 0.4
+    assert current.s.tolist() == [stationary, rolling]
+    assert current.mu.tolist() == [ball1.params.u_r, ball2.params.u_r]
+    assert current.R is arrays.R
+    assert arrays.s.tolist() == [stationary, sliding]
+
+    # No balls
+    assert BallArrays.from_balls(()).rvw.shape == (0, 3, 3)
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import copy
 from functools import cached_property
-from typing import Dict, Union
+from math import sqrt
+from typing import Dict, Tuple, Union
 
 import numpy as np
 from attrs import define, evolve, field
@@ -65,28 +66,45 @@ class LinearCushionSegment:
         return are_dataclasses_equal(self, other)
 
     @cached_property
-    def height(self):
-        return self.p1[2]
+    def height(self) -> float:
+        return float(self.p1[2])
+
+    @cached_property
+    def _line_coeffs(self) -> Tuple[float, float, float]:
+        """The coefficients (lx, ly, l0) of the line lx*x + ly*y + l0 = 0
+
+        Computed with python floats rather than numpy scalars, which are much slower
+        for scalar arithmetic. Returning floats also means the numba-compiled collision
+        functions always see the same argument types.
+        """
+        p1x, p1y, _ = self.p1.tolist()
+        p2x, p2y, _ = self.p2.tolist()
+
+        if (p2x - p1x) == 0:
+            return 1.0, 0.0, float(-p1x)
+
+        slope = (p2y - p1y) / (p2x - p1x)
+        return -slope, 1.0, slope * p1x - p1y
 
     @cached_property
-    def lx(self):
-        p1x, p1y, _ = self.p1
-        p2x, p2y, _ = self.p2
-        return 1 if (p2x - p1x) == 0 else -(p2y - p1y) / (p2x - p1x)
+    def lx(self) -> float:
+        return self._line_coeffs[0]
 
     @cached_property
-    def ly(self):
-        return 0 if (self.p2[0] - self.p1[0]) == 0 else 1
+    def ly(self) -> float:
+        return self._line_coeffs[1]
 
     @cached_property
-    def l0(self):
-        p1x, p1y, _ = self.p1
-        p2x, p2y, _ = self.p2
-        return -p1x if (p2x - p1x) == 0 else (p2y - p1y) / (p2x - p1x) * p1x - p1y
+    def l0(self) -> float:
+        return self._line_coeffs[2]
 
     @cached_property
-    def normal(self):
-        return math.unit_vector(np.array([self.lx, self.ly, 0]))
+    def normal(self) -> NDArray[np.float64]:
+        # The normal has no z-component, so it is normalized inline rather than with
+        # math.unit_vector
+        lx, ly = self.lx, self.ly
+        norm = sqrt(lx * lx + ly * ly)
+        return np.array([lx / norm, ly / norm, 0.0], dtype=np.float64)
 
     def get_normal(self, rvw):
         return self.normal
@@ -168,6 +186,77 @@ class CircularCushionSegment:
 CushionSegment = Union[LinearCushionSegment, CircularCushionSegment]
 
 
+@define(frozen=True)
+class LinearCushionArrays:
+    """The linear cushion segments, stacked into arrays (see `BallArrays`)
+
+    Element i of each array describes the segment with id `ids[i]`.
+    """
+
+    ids: Tuple[str, ...]
+    lx: NDArray[np.float64]
+    ly: NDArray[np.float64]
+    l0: NDArray[np.float64]
+    p1: NDArray[np.float64]
+    p2: NDArray[np.float64]
+    direction: NDArray[np.int64]
+
+    def __attrs_post_init__(self):
+        # The arrays are read only
+        self.lx.flags["WRITEABLE"] = False
+        self.ly.flags["WRITEABLE"] = False
+        self.l0.flags["WRITEABLE"] = False
+        self.p1.flags["WRITEABLE"] = False
+        self.p2.flags["WRITEABLE"] = False
+        self.direction.flags["WRITEABLE"] = False
+
+    @staticmethod
+    def from_segments(segments: Dict[str, LinearCushionSegment]) -> LinearCushionArrays:
+        cushions = segments.values()
+
+        return LinearCushionArrays(
+            ids=tuple(segments),
+            lx=np.array([c.lx for c in cushions], dtype=np.float64),
+            ly=np.array([c.ly for c in cushions], dtype=np.float64),
+            l0=np.array([c.l0 for c in cushions], dtype=np.float64),
+            p1=np.array([c.p1 for c in cushions], dtype=np.float64).reshape(-1, 3),
+            p2=np.array([c.p2 for c in cushions], dtype=np.float64).reshape(-1, 3),
+            direction=np.array([c.direction for c in cushions], dtype=np.int64),
+        )
+
+
+@define(frozen=True)
+class CircleArrays:
+    """Circular table objects (circular cushion segments or pockets) stacked into arrays
+
+    Element i of each array describes the object with id `ids[i]` (see `BallArrays`).
+    """
+
+    ids: Tuple[str, ...]
+    a: NDArray[np.float64]
+    b: NDArray[np.float64]
+    r: NDArray[np.float64]
+
+    def __attrs_post_init__(self):
+        # The arrays are read only
+        self.a.flags["WRITEABLE"] = False
+        self.b.flags["WRITEABLE"] = False
+        self.r.flags["WRITEABLE"] = False
+
+    @staticmethod
+    def from_circles(
+        circles: Union[Dict[str, CircularCushionSegment], Dict[str, Pocket]]
+    ) -> CircleArrays:
+        objs = circles.values()
+
+        return CircleArrays(
+            ids=tuple(circles),
+            a=np.array([obj.a for obj in objs], dtype=np.float64),
+            b=np.array([obj.b for obj in objs], dtype=np.float64),
+            r=np.array([obj.radius for obj in objs], dtype=np.float64),
+        )
+
+
 @define
 class CushionSegments:
     linear: Dict[str, LinearCushionSegment]
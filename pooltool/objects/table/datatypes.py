@@ -13,7 +13,12 @@ from pooltool.objects.table._layout import (
     _create_pocket_table_cushion_segments,
     _create_pocket_table_pockets,
 )
-from pooltool.objects.table.components import CushionSegments, Pocket
+from pooltool.objects.table.components import (
+    CircleArrays,
+    CushionSegments,
+    LinearCushionArrays,
+    Pocket,
+)
 from pooltool.utils import panda_path, strenum
 
 
@@ -220,3 +225,24 @@ class Table:
     @staticmethod
     def default() -> Table:
         return Table.pocket_table()
+
+
+@define(frozen=True)
+class TableArrays:
+    """The table's cushion segments and pockets, stacked into arrays (see `BallArrays`)
+
+    The arrays are built from the table at the time of creation, so this is a
+    snapshot of the table.
+    """
+
+    linear: LinearCushionArrays
+    circular: CircleArrays
+    pockets: CircleArrays
+
+    @staticmethod
+    def from_table(table: Table) -> TableArrays:
+        return TableArrays(
+            linear=LinearCushionArrays.from_segments(table.cushion_segments.linear),
+            circular=CircleArrays.from_circles(table.cushion_segments.circular),
+            pockets=CircleArrays.from_circles(table.pockets),
+        )
@@ -3,8 +3,10 @@ import pytest
 from attrs.exceptions import FrozenInstanceError
 
 from pooltool.objects.table.components import (
+    CircleArrays,
     CircularCushionSegment,
     CushionSegments,
+    LinearCushionArrays,
     LinearCushionSegment,
     Pocket,
 )
@@ -188,3 +190,45 @@ def test_cushion_segments_copy(lin_seg, circ_seg):
     # But you can add new elements to `copy` without changing `segments`
     copy.linear["new"] = circ_seg
     assert "new" not in segments.linear
+
+
+def test_linear_cushion_arrays(lin_seg):
+    other = LinearCushionSegment(
+        "other", p1=np.array([2, 0, 0]), p2=np.array([2, 1, 0]), direction=1
+    )
+    segments = {lin_seg.id: lin_seg, other.id: other}
+    arrays = LinearCushionArrays.from_segments(segments)
+
+    # Row i corresponds to segment ids[i]
+    assert arrays.ids == (lin_seg.id, other.id)
+    for i, seg in enumerate(segments.values()):
+        assert arrays.lx[i] == seg.lx
+        assert arrays.ly[i] == seg.ly
+        assert arrays.l0[i] == seg.l0
+        assert np.array_equal(arrays.p1[i], seg.p1)
+        assert np.array_equal(arrays.p2[i], seg.p2)
+        assert arrays.direction[i] == seg.direction
+
+    # The arrays are read only
+    with pytest.raises(ValueError, match="assignment destination is read-only"):
+        arrays.lx[0] = 4
+
+
+def test_circle_arrays(circ_seg, pocket):
+    other = CircularCushionSegment("other", center=np.array([2, 3, 0]), radius=0.5)
+    arrays = CircleArrays.from_circles({circ_seg.id: circ_seg, other.id: other})
+
+    # Row i corresponds to segment ids[i]
+    assert arrays.ids == (circ_seg.id, other.id)
+    assert arrays.a.tolist() == [0, 2]
+    assert arrays.b.tolist() == [0, 3]
+    assert arrays.r.tolist() == [1, 0.5]
+
+    # The arrays are read only
+    with pytest.raises(ValueError, match="assignment destination is read-only"):
+        arrays.a[0] = 4
+
+    # Pockets are circles too
+    arrays = CircleArrays.from_circles({pocket.id: pocket})
+    assert arrays.ids == (pocket.id,)
+    assert arrays.r.tolist() == [pocket.radius]
@@ -45,6 +45,7 @@ def get_spin_time(rvw, R, u_sp, g):
     return np.abs(w[2]) * 2 / 5 * R / u_sp / g
 
 
+@jit(nopython=True, cache=const.numba_cache)
 def get_ball_energy(rvw, R, m):
     """Get the energy of a ball
 
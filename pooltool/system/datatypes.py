@@ -6,12 +6,13 @@ from typing import Dict, Iterator, List, Optional
 
 import numpy as np
 from attrs import define, field
+from numpy.typing import NDArray
 
 import pooltool.math as math
 import pooltool.physics.utils as physics_utils
 from pooltool.error import ConfigError
 from pooltool.events import Event
-from pooltool.objects.ball.datatypes import Ball, BallHistory, BallState
+from pooltool.objects.ball.datatypes import Ball, BallArrays, BallHistory, BallState
 from pooltool.objects.cue.datatypes import Cue
 from pooltool.objects.table.datatypes import Table
 from pooltool.potting import PottingConfig
@@ -41,12 +42,21 @@ class System:
         raise NotImplementedError()
 
     def update_history(self, event: Event):
-        """Updates the history for all balls"""
-        self.t = event.time
+        """Updates the history for all balls
+
+        Each ball's state is copied into its history. Events are resolved by modifying
+        ball states in place (see e.g. `CoreBallBallCollision.make_kiss`), and a state
+        is carried over unchanged to the next event when the ball doesn't move. Without
+        the copy, resolving an event could modify states already in the history.
+        """
+        t = self.t = event.time
 
         for ball in self.balls.values():
-            ball.state.t = event.time
-            ball.history.add(ball.state)
+            # Replacing the state is cheaper than setting its time, since attrs runs the
+            # converters of BallState on assignment
+            state = ball.state
+            ball.state = BallState(state.rvw, state.s, t)
+            ball.history.add(BallState(state.rvw.copy(), state.s, t))
 
         self.events.append(event)
 
@@ -209,15 +219,16 @@ class System:
     ) -> bool:
         """Randomize ball positions on the table--ensure no overlap
 
-        This "algorithm" initializes a random state, and checks that all the balls are
-        non-overlapping. If any are, a new state is initialized and the process is
-        repeated. This is an inefficient algorithm, in case that needs to be said.
+        Balls are placed one at a time. Random positions are drawn for a ball until
+        one is found that doesn't overlap with any ball placed so far, or with any ball
+        that isn't being randomized.
 
         Args:
             ball_ids:
                 Only these balls will be randomized.
             niter:
-                The number of iterations tried until the algorithm gives up.
+                The number of positions tried for each ball until the algorithm gives
+                up.
 
         Returns:
             True if all balls are non-overlapping. Returns False otherwise.
@@ -226,37 +237,60 @@ class System:
         if ball_ids is None:
             ball_ids = list(self.balls.keys())
 
-        for _ in range(niter):
-            for ball_id in ball_ids:
-                ball = self.balls[ball_id]
-                R = ball.params.R
-                ball.state.rvw[0] = [
-                    np.random.uniform(R, self.table.w - R),
-                    np.random.uniform(R, self.table.l - R),
-                    R,
-                ]
+        # The positions and radii of all placed balls, starting with the balls that
+        # aren't being randomized
+        positions = np.empty((len(self.balls), 3), dtype=np.float64)
+        radii = np.empty(len(self.balls), dtype=np.float64)
+        num_placed = 0
+
+        for ball_id, ball in self.balls.items():
+            if ball_id not in ball_ids:
+                positions[num_placed] = ball.state.rvw[0]
+                radii[num_placed] = ball.params.R
+                num_placed += 1
+
+        # Balls that aren't being randomized stay put, so if they overlap, so will the
+        # result
+        if _is_overlapping(positions[:num_placed], radii[:num_placed]):
+            return False
+
+        for ball_id in ball_ids:
+            ball = self.balls[ball_id]
+            R = ball.params.R
+
+            for _ in range(niter):
+                # Equivalent to np.random.uniform(R, w - R), which draws the same number
+                # from the global random state, but has far more call overhead
+                position = np.array(
+                    [
+                        R + (self.table.w - R - R) * np.random.random_sample(),
+                        R + (self.table.l - R - R) * np.random.random_sample(),
+                        R,
+                    ]
+                )
 
-            if not self.is_balls_overlapping():
-                return True
+                # Squared distances to each placed ball
+                d2 = ((positions[:num_placed] - position) ** 2).sum(axis=1)
 
-        return False
+                if not (d2 < (radii[:num_placed] + R) ** 2).any():
+                    break
+            else:
+                return False
 
-    def is_balls_overlapping(self):
-        for ball1 in self.balls.values():
-            for ball2 in self.balls.values():
-                if ball1 is ball2:
-                    continue
+            ball.state.rvw[0] = position
+            positions[num_placed] = position
+            radii[num_placed] = R
+            num_placed += 1
 
-                assert (
-                    ball1.params.R == ball2.params.R
-                ), "Balls are assumed to be equal radii"
+        return True
 
-                if physics_utils.is_overlapping(
-                    ball1.state.rvw, ball2.state.rvw, ball1.params.R, ball2.params.R
-                ):
-                    return True
+    def is_balls_overlapping(self) -> bool:
+        """Return whether any two balls overlap
 
-        return False
+        All pairs of balls are compared at once.
+        """
+        arrays = BallArrays.from_balls(tuple(self.balls.values()))
+        return _is_overlapping(arrays.rvw[:, 0], arrays.R)
 
     def copy(self) -> System:
         """Make deepcopy of the system"""
@@ -386,3 +420,13 @@ class MultiSystem:
 
 
 multisystem = MultiSystem()
+
+
+def _is_overlapping(positions: NDArray[np.float64], radii: NDArray[np.float64]) -> bool:
+    """Return whether any two balls, given their positions and radii, overlap"""
+    i, j = np.triu_indices(len(positions), k=1)
+
+    # Squared distances between each pair of balls
+    d2 = ((positions[i] - positions[j]) ** 2).sum(axis=1)
+
+    return bool((d2 < (radii[i] + radii[j]) ** 2).any())
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from attrs import evolve
+
+from pooltool.evolution.event_based.simulate import simulate
+from pooltool.layouts import get_nine_ball_rack
+from pooltool.objects.cue.datatypes import Cue
+from pooltool.objects.table.datatypes import Table
+from pooltool.system.datatypes import System
+
+
+@pytest.fixture
+def system():
+    table = Table.pocket_table()
+    return System(
+        cue=Cue(cue_ball_id="cue"), table=table, balls=get_nine_ball_rack(table)
+    )
+
+
+def test_randomize_positions(system):
+    fixed = {"1": system.balls["1"].state.rvw[0].copy()}
+    randomized = [ball_id for ball_id in system.balls if ball_id not in fixed]
+
+    np.random.seed(42)
+    assert system.randomize_positions(ball_ids=randomized)
+    assert not system.is_balls_overlapping()
+
+    # Non-randomized balls stay put
+    assert np.array_equal(system.balls["1"].state.rvw[0], fixed["1"])
+
+    for ball in system.balls.values():
+        R = ball.params.R
+        x, y, z = ball.state.rvw[0]
+        assert R <= x <= system.table.w - R
+        assert R <= y <= system.table.l - R
+        assert z == R
+
+
+def test_randomize_positions_give_up(system):
+    # A fixed ball so large that it overlaps every possible position
+    ball = system.balls["1"]
+    ball.params = evolve(ball.params, R=10 * system.table.l)
+
+    assert not system.randomize_positions(ball_ids=["cue"], niter=10)
+
+
+def test_randomize_positions_fixed_balls_overlap(system):
+    # The 2 ball is moved onto the 1 ball. Neither is randomized, so the balls can't
+    # all be made non-overlapping
+    system.balls["2"].state.rvw[0] = system.balls["1"].state.rvw[0]
+
+    assert not system.randomize_positions(ball_ids=["cue"])
+    assert system.is_balls_overlapping()
+
+
+def test_is_balls_overlapping(system):
+    # The rack is spaced out a little
+    assert not system.is_balls_overlapping()
+
+    # Move the 1 ball away from the rack. Then put the cue ball just out of reach of
+    # it, and then just within reach
+    one, cue = system.balls["1"], system.balls["cue"]
+    x, y, z = system.table.w / 2, 0.2, one.params.R
+    one.state.rvw[0] = [x, y, z]
+    cue.state.rvw[0] = [x, y - 2.001 * cue.params.R, z]
+    assert not system.is_balls_overlapping()
+    cue.state.rvw[0] = [x, y - 1.999 * cue.params.R, z]
+    assert system.is_balls_overlapping()
+
+    # A bigger cue ball overlaps from further away
+    cue.state.rvw[0] = [x, y - 2.1 * one.params.R, z]
+    assert not system.is_balls_overlapping()
+    cue.params = evolve(cue.params, R=1.2 * one.params.R)
+    assert system.is_balls_overlapping()
+
+
+def test_update_history_copies_states(system):
+    # The cue ball hits the stationary rack, whose balls are moved in place when
+    # collisions are resolved. That must not affect their recorded histories
+    system.aim_at_ball("1")
+    system.strike(V0=5)
+    simulate(system, inplace=True)
+
+    for ball in system.balls.values():
+        states = ball.history.states
+        assert states[-1] is not ball.state
+        for state1, state2 in zip(states[:-1], states[1:]):
+            assert not np.shares_memory(state1.rvw, state2.rvw)